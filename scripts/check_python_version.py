@@ -3,42 +3,48 @@
 Check Python version compatibility for FireLens Monitor
 Ensures Python 3.9+ is installed
 """
+import importlib.util
 import sys
 
+# Shown for Python 3 releases older than the minimum recommended version
+_UPGRADE_WARNING = [
+    "\n⚠️  WARNING: Python {version} detected",
+    "   Minimum recommended version: Python 3.9",
+    "   Some dependencies may not work correctly",
+    "   Please consider upgrading to Python 3.9+",
+]
+
+# (minimum version, compatible, messages) - checked newest first
+_VERSION_TABLE = [
+    ((3, 9), True, ["\n✅ Python {version} is compatible", "   All features supported"]),
+    (
+        (3, 7),
+        True,
+        _UPGRADE_WARNING + ["\n✓ Python 3.7+ detected - may work but not fully tested"],
+    ),
+    ((3, 0), False, _UPGRADE_WARNING + ["\n❌ ERROR: Python 3.7+ is required (dataclasses)"]),
+    ((0, 0), False, ["\n❌ ERROR: Python 3 is required", "   Please install Python 3.9 or higher"]),
+]
+
+
 def check_python_version():
     """Check if Python version is compatible"""
 
     # Get version info
     version = sys.version_info
-    version_string = f"{version.major}.{version.minor}.{version.micro}"
+    version_string = "%d.%d.%d" % version[:3]
 
     print(f"Current Python Version: {version_string}")
     print(f"Version Info: {sys.version}")
 
-    # Check minimum version (3.9)
-    if version.major < 3:
-        print("\n❌ ERROR: Python 3 is required")
-        print("   Please install Python 3.9 or higher")
-        return False
-
-    if version.major == 3 and version.minor < 9:
-        print(f"\n⚠️  WARNING: Python {version_string} detected")
-        print("   Minimum recommended version: Python 3.9")
-        print("   Some dependencies may not work correctly")
-        print("   Please consider upgrading to Python 3.9+")
-
-        # Still might work with 3.7-3.8
-        if version.minor >= 7:
-            print("\n✓ Python 3.7+ detected - may work but not fully tested")
-            return True
-        else:
-            print("\n❌ ERROR: Python 3.7+ is required (dataclasses)")
-            return False
+    current = version[:2]
+    for min_version, compatible, messages in _VERSION_TABLE:
+        if current >= min_version:
+            for message in messages:
+                print(message.format(version=version_string))
+            return compatible
 
-    # Python 3.9+
-    print(f"\n✅ Python {version_string} is compatible")
-    print("   All features supported")
-    return True
+    return False
 
 
 def check_required_modules():
@@ -57,6 +63,8 @@ def check_required_modules():
     print("\nChecking required standard library modules:")
     all_ok = True
 
+    # Import for real: find_spec() succeeds for sqlite3 even when Python was
+    # built without the _sqlite3 extension, which is what this check must catch
     for module_name, description in required_modules:
         try:
             __import__(module_name)
@@ -86,12 +94,13 @@ def check_dependencies():
     installed = []
     missing = []
 
+    # find_spec locates the module without executing it, so heavy packages
+    # like pandas and fastapi are not imported just to check they exist
     for module_name, description in dependencies:
-        try:
-            __import__(module_name)
+        if importlib.util.find_spec(module_name) is not None:
             print(f"  ✓ {module_name:20s} - {description}")
             installed.append(module_name)
-        except ImportError:
+        else:
             print(f"  ✗ {module_name:20s} - NOT INSTALLED: {description}")
             missing.append(module_name)
 
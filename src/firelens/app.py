@@ -9,7 +9,7 @@ import logging
 import signal
 import sys
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import psutil
 
@@ -18,7 +18,9 @@ from .collectors import MultiFirewallCollector
 # Import our modules
 from .config import ConfigManager
 from .database import MetricsDatabase
-from .web_dashboard import WebDashboard
+
+if TYPE_CHECKING:
+    from .web_dashboard import WebDashboard
 
 LOG = logging.getLogger("FireLens.main")
 
@@ -42,7 +44,7 @@ class FireLensApp:
         self.config_manager = ConfigManager(config_file)
         self.database: Optional[MetricsDatabase] = None
         self.collector_manager: Optional[MultiFirewallCollector] = None
-        self.web_dashboard: Optional[WebDashboard] = None
+        self.web_dashboard: Optional["WebDashboard"] = None
         self.killer = GracefulKiller()
 
         # Setup logging
@@ -104,6 +106,9 @@ class FireLensApp:
         # Initialize web dashboard
         if self.config_manager.global_config.web_dashboard:
             LOG.info("Initializing web dashboard")
+            # Imported here so FastAPI is only loaded when the dashboard is enabled
+            from .web_dashboard import WebDashboard
+
             self.web_dashboard = WebDashboard(
                 self.database, self.config_manager, self.collector_manager
             )
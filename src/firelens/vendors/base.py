@@ -4,13 +4,19 @@ FireLens Monitor - Vendor Abstraction Layer
 Abstract base classes for multi-vendor firewall support
 """
 
+import asyncio
+import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class InterfaceSample:
     """Raw interface counters at one point in time - vendor agnostic"""
 
@@ -26,7 +32,7 @@ class InterfaceSample:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SessionStats:
     """Session statistics - vendor agnostic"""
 
@@ -39,7 +45,7 @@ class SessionStats:
     session_rate: float = 0.0  # Sessions per second
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class HardwareInfo:
     """Hardware information - vendor agnostic with optional vendor-specific fields"""
 
@@ -53,10 +59,10 @@ class HardwareInfo:
 
     def __post_init__(self):
         if self.vendor_specific is None:
-            self.vendor_specific = {}
+            object.__setattr__(self, "vendor_specific", {})
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SystemMetrics:
     """System metrics - vendor agnostic"""
 
@@ -68,7 +74,7 @@ class SystemMetrics:
 
     def __post_init__(self):
         if self.vendor_metrics is None:
-            self.vendor_metrics = {}
+            object.__setattr__(self, "vendor_metrics", {})
 
 
 class VendorClient(ABC):
@@ -82,6 +88,9 @@ class VendorClient(ABC):
     - Error handling
     """
 
+    # Empty so subclasses that declare __slots__ get no per-instance __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def vendor_name(self) -> str:
@@ -181,6 +190,35 @@ class VendorClient(ABC):
         self.close()
         return False
 
+    # Async variants run the blocking call in a worker thread so callers on an
+    # event loop can poll many devices concurrently with asyncio.gather()
+
+    async def aauthenticate(self, username: str, password: str) -> bool:
+        """Async variant of authenticate()"""
+        return await asyncio.to_thread(self.authenticate, username, password)
+
+    async def acollect_system_metrics(self) -> SystemMetrics:
+        """Async variant of collect_system_metrics()"""
+        return await asyncio.to_thread(self.collect_system_metrics)
+
+    async def acollect_interface_stats(
+        self, interfaces: Optional[List[str]] = None
+    ) -> Dict[str, InterfaceSample]:
+        """Async variant of collect_interface_stats()"""
+        return await asyncio.to_thread(self.collect_interface_stats, interfaces)
+
+    async def acollect_session_stats(self) -> SessionStats:
+        """Async variant of collect_session_stats()"""
+        return await asyncio.to_thread(self.collect_session_stats)
+
+    async def aget_hardware_info(self) -> HardwareInfo:
+        """Async variant of get_hardware_info()"""
+        return await asyncio.to_thread(self.get_hardware_info)
+
+    async def adiscover_interfaces(self) -> List[str]:
+        """Async variant of discover_interfaces()"""
+        return await asyncio.to_thread(self.discover_interfaces)
+
 
 class VendorAdapter(ABC):
     """
@@ -190,6 +228,8 @@ class VendorAdapter(ABC):
     clients and collectors for that vendor's firewalls.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def vendor_name(self) -> str:
@@ -220,36 +260,50 @@ class VendorAdapter(ABC):
         pass
 
     @abstractmethod
-    def get_supported_metrics(self) -> List[str]:
+    def get_supported_metrics(self) -> Sequence[str]:
         """
         Get list of metrics supported by this vendor.
 
         Returns:
-            List of metric names (e.g., ['cpu_usage', 'mgmt_cpu', 'data_plane_cpu'])
+            Sequence of metric names (e.g., ['cpu_usage', 'mgmt_cpu', 'data_plane_cpu'])
         """
         pass
 
     @abstractmethod
-    def get_hardware_fields(self) -> List[str]:
+    def get_hardware_fields(self) -> Sequence[str]:
         """
         Get list of hardware info fields supported by this vendor.
 
         Returns:
-            List of field names (e.g., ['model', 'serial', 'platform_family'])
+            Sequence of field names (e.g., ['model', 'serial', 'platform_family'])
         """
         pass
 
-    def get_default_exclude_interfaces(self) -> List[str]:
+    def get_default_exclude_interfaces(self) -> Sequence[str]:
         """
         Get default interface name patterns to exclude from monitoring.
 
         Override in vendor implementations for vendor-specific defaults.
 
         Returns:
-            List of interface name patterns to exclude
+            Sequence of interface name patterns to exclude
         """
         return ["mgmt", "management", "loopback", "lo"]
 
+    def get_default_exclude_regex(self) -> "re.Pattern[str]":
+        """
+        Get the default exclusion patterns compiled as a single regex.
+
+        Built from get_default_exclude_interfaces(). Matches the way exclusions are
+        applied in config: a case-insensitive substring test anywhere in the name.
+        Vendors may override this with a precompiled pattern.
+
+        Returns:
+            Compiled pattern; ``pattern.search(name)`` is truthy for excluded interfaces
+        """
+        patterns = self.get_default_exclude_interfaces()
+        return re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
+
 
 # Type alias for vendor registry
 VendorRegistry = Dict[str, type]
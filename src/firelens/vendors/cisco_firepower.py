@@ -1,32 +1,28 @@
 #!/usr/bin/env python3
 """
 FireLens Monitor - Cisco Firepower Vendor Implementation
-
-Supports both management interfaces:
-- FDM (Firepower Device Manager) - Local REST API for direct device access
-- FMC (Firepower Management Center) - Centralized API for multi-device deployments
-
-API Documentation:
-- FDM REST API: https://developer.cisco.com/docs/ftd-rest-api/
-- FMC REST API: https://developer.cisco.com/docs/fmc-rest-api/
-
-Architecture Notes:
-- FTD (Firepower Threat Defense) is the OS running on Firepower hardware
-- Can be managed by FMC (Firepower Management Center) or FDM (local management)
-- FDM uses OAuth2 token authentication
-- FMC uses HTTP Basic Auth with token response in headers
+FDM and FMC REST API clients. See docs/vendors/cisco_firepower.md for API details.
 """
 
 import logging
 import re
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# orjson parses large interface/connection listings several times faster
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException
+from urllib3.util.retry import Retry
 
-from . import register_vendor
+from . import is_vendor_supported, register_vendor
 from .base import (
     HardwareInfo,
     InterfaceSample,
@@ -40,9 +36,67 @@ LOG = logging.getLogger("FireLens.vendors.cisco_firepower")
 
 # Constants
 TOKEN_REFRESH_MARGIN_MINUTES = 5  # Refresh token when within 5 minutes of expiry
+FMC_TOKEN_LIFETIME = 30 * 60  # seconds
 DEFAULT_TIMEOUT = 30  # seconds
+INTERFACE_CACHE_TTL = 5 * 60  # seconds; interface topology rarely changes
 FDM_API_VERSION = "v6"
 FMC_API_VERSION = "v1"
+DOCS_URL = "https://github.com/mancow2001/FireLens/blob/main/docs/vendors/cisco_firepower.md"
+
+# Adapter capability lists, shared across calls since they never change
+_SUPPORTED_METRICS = (
+    "cpu_usage",
+    "cpu_5sec",
+    "cpu_1min",
+    "cpu_5min",
+    "memory_usage",
+    "disk_usage",
+    "active_connections",
+    "max_connections",
+    "xlate_count",
+)
+_HARDWARE_FIELDS = (
+    "model",
+    "serial",
+    "hostname",
+    "sw_version",
+    "device_type",
+    "management_mode",
+)
+
+# Default interface name patterns excluded from monitoring
+_EXCLUDE_PATTERNS = (
+    "Management",
+    "Diagnostic",
+    "nlp_int_tap",
+    "ccl_ha_port",
+    "cmi_mgmt_int",
+    "Internal-",
+)
+# Single alternation so each interface name is checked in one pass; like the
+# config exclusion filter this is a case-insensitive substring match
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, _EXCLUDE_PATTERNS)), re.IGNORECASE)
+
+# CLI output parsers, e.g. "CPU utilization for 5 seconds = 15%; 1 minute: 12%; 5 minutes: 10%"
+_CPU_RE = re.compile(r"(5 seconds|1 minute|5 minutes)\s*[=:]\s*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE)
+_CPU_INTERVAL_KEYS = {"5 seconds": "cpu_5sec", "1 minute": "cpu_1min", "5 minutes": "cpu_5min"}
+# e.g. "1234 in use, 5678 most used"
+_CONN_RE = re.compile(r"(\d+)\s+in\s+use[,\s]+(\d+)\s+most\s+used", re.IGNORECASE)
+
+# Retry policy mounted on every client session. Only 429/503 are retried, with
+# backoff honouring Retry-After; connect errors are not retried and read
+# timeouts are re-raised as ReadTimeout, so a hung device fails after one timeout.
+_RETRY_POLICY = Retry(
+    total=3,
+    connect=0,
+    read=False,
+    other=0,
+    status=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 503),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
 
 
 @dataclass
@@ -59,25 +113,31 @@ class FMCManagedDevice:
 
 
 class CiscoFirepowerFDMClient(VendorClient):
-    """
-    Cisco Firepower Threat Defense (FTD) client using FDM REST API.
-
-    FDM (Firepower Device Manager) provides local management for single devices.
-    Uses OAuth2 token authentication.
-
-    Authentication:
-    - POST /api/fdm/v6/fdm/token with grant_type=password
-    - Token valid for 30 minutes, refreshable
-
-    Supported Platforms:
-    - Firepower 1000/2100/4100 Series
-    - Firepower 9300
-    - FTDv (Virtual)
-    """
+    """Cisco FTD REST API client (FDM). See docs/vendors/cisco_firepower.md for API details."""
 
     VENDOR_NAME = "Cisco Firepower (FDM)"
     VENDOR_TYPE = "cisco_firepower"
 
+    __slots__ = (
+        "_host",
+        "_base_url",
+        "_verify_ssl",
+        "_ca_bundle_path",
+        "_access_token",
+        "_refresh_token",
+        "_token_deadline",
+        "_session",
+        "_authenticated",
+        "_hardware_info",
+        "_interfaces_cache",
+        "_interfaces_cache_deadline",
+        "_token_url",
+        "_systeminfo_url",
+        "_devicestatus_url",
+        "_interfaces_url",
+        "_clicommand_url",
+    )
+
     def __init__(self, host: str, verify_ssl: bool = True, ca_bundle_path: Optional[str] = None):
         """
         Initialize FDM client.
@@ -91,16 +151,26 @@ class CiscoFirepowerFDMClient(VendorClient):
         if not self._host.startswith("http"):
             self._host = f"https://{self._host}"
         self._base_url = f"{self._host}/api/fdm/{FDM_API_VERSION}"
+        # Endpoint URLs are fixed per device, so build them once
+        self._token_url = f"{self._base_url}/fdm/token"
+        self._systeminfo_url = f"{self._base_url}/operational/systeminfo"
+        self._devicestatus_url = f"{self._base_url}/operational/devicestatus"
+        self._interfaces_url = f"{self._base_url}/operational/interfaces"
+        self._clicommand_url = f"{self._base_url}/action/clicommand"
         self._verify_ssl = verify_ssl
         self._ca_bundle_path = ca_bundle_path
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        # Token expiry as a time.monotonic() deadline (0.0 until authenticated)
+        self._token_deadline = 0.0
         self._session: Optional[requests.Session] = None
         self._authenticated = False
         self._hardware_info: Optional[HardwareInfo] = None
+        # discover_interfaces() result, reused until the time.monotonic() deadline
+        self._interfaces_cache: Optional[List[str]] = None
+        self._interfaces_cache_deadline = 0.0
 
-        LOG.debug(f"FDM client initialized for {self._host}")
+        LOG.debug("FDM client initialized for %s", self._host)
 
     @property
     def vendor_name(self) -> str:
@@ -121,6 +191,8 @@ class CiscoFirepowerFDMClient(VendorClient):
     def _create_session(self) -> requests.Session:
         """Create and configure a requests session."""
         session = requests.Session()
+        # Per-session adapter keeps each device's keep-alive connection to itself
+        session.mount("https://", HTTPAdapter(max_retries=_RETRY_POLICY))
         session.headers.update(
             {
                 "Content-Type": "application/json",
@@ -140,13 +212,12 @@ class CiscoFirepowerFDMClient(VendorClient):
         Returns:
             True if authentication successful
         """
-        LOG.debug(f"Authenticating to FDM at {self._host}")
+        LOG.debug("Authenticating to FDM at %s", self._host)
 
         self._session = self._create_session()
 
         try:
             # OAuth2 password grant
-            auth_url = f"{self._base_url}/fdm/token"
             auth_data = {
                 "grant_type": "password",
                 "username": username,
@@ -154,7 +225,7 @@ class CiscoFirepowerFDMClient(VendorClient):
             }
 
             response = self._session.post(
-                auth_url,
+                self._token_url,
                 json=auth_data,
                 verify=self._get_verify_param(),
                 timeout=DEFAULT_TIMEOUT,
@@ -167,7 +238,7 @@ class CiscoFirepowerFDMClient(VendorClient):
 
             # Calculate token expiration
             expires_in = token_data.get("expires_in", 1800)  # Default 30 min
-            self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+            self._token_deadline = time.monotonic() + expires_in
 
             # Set authorization header
             self._session.headers["Authorization"] = f"Bearer {self._access_token}"
@@ -194,14 +265,11 @@ class CiscoFirepowerFDMClient(VendorClient):
 
     def is_authenticated(self) -> bool:
         """Check if client is currently authenticated with valid token."""
-        if not self._authenticated or not self._access_token:
-            return False
-
-        if self._token_expires_at:
-            if datetime.now(timezone.utc) >= self._token_expires_at:
-                return False
-
-        return True
+        return (
+            self._authenticated
+            and self._access_token is not None
+            and time.monotonic() < self._token_deadline
+        )
 
     def _refresh_token_if_needed(self) -> bool:
         """
@@ -213,18 +281,14 @@ class CiscoFirepowerFDMClient(VendorClient):
         if not self._authenticated or not self._session:
             return False
 
-        if not self._token_expires_at:
-            return True
-
         # Check if token expires within margin
-        time_until_expiry = self._token_expires_at - datetime.now(timezone.utc)
-        if time_until_expiry > timedelta(minutes=TOKEN_REFRESH_MARGIN_MINUTES):
+        time_until_expiry = self._token_deadline - time.monotonic()
+        if time_until_expiry > TOKEN_REFRESH_MARGIN_MINUTES * 60:
             return True
 
         LOG.debug("Refreshing FDM access token")
 
         try:
-            auth_url = f"{self._base_url}/fdm/token"
             refresh_data = {
                 "grant_type": "refresh_token",
                 "refresh_token": self._refresh_token,
@@ -234,7 +298,7 @@ class CiscoFirepowerFDMClient(VendorClient):
             old_auth = self._session.headers.pop("Authorization", None)
 
             response = self._session.post(
-                auth_url,
+                self._token_url,
                 json=refresh_data,
                 verify=self._get_verify_param(),
                 timeout=DEFAULT_TIMEOUT,
@@ -246,7 +310,7 @@ class CiscoFirepowerFDMClient(VendorClient):
             self._refresh_token = token_data.get("refresh_token")
 
             expires_in = token_data.get("expires_in", 1800)
-            self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+            self._token_deadline = time.monotonic() + expires_in
 
             self._session.headers["Authorization"] = f"Bearer {self._access_token}"
 
@@ -270,13 +334,16 @@ class CiscoFirepowerFDMClient(VendorClient):
         Returns:
             JSON response as dictionary
         """
+        return self._get_url(f"{self._base_url}/{endpoint.lstrip('/')}")
+
+    def _get_url(self, url: str) -> Dict[str, Any]:
+        """Make GET request to a fully built FDM API URL."""
         if not self._refresh_token_if_needed():
             raise RuntimeError("Not authenticated or token refresh failed")
 
-        url = f"{self._base_url}/{endpoint.lstrip('/')}"
         response = self._session.get(url, verify=self._get_verify_param(), timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return _json.loads(response.content)
 
     def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -289,15 +356,18 @@ class CiscoFirepowerFDMClient(VendorClient):
         Returns:
             JSON response as dictionary
         """
+        return self._post_url(f"{self._base_url}/{endpoint.lstrip('/')}", data)
+
+    def _post_url(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make POST request to a fully built FDM API URL."""
         if not self._refresh_token_if_needed():
             raise RuntimeError("Not authenticated or token refresh failed")
 
-        url = f"{self._base_url}/{endpoint.lstrip('/')}"
         response = self._session.post(
             url, json=data, verify=self._get_verify_param(), timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
-        return response.json()
+        return _json.loads(response.content)
 
     def _execute_cli(self, command: str) -> str:
         """
@@ -309,16 +379,16 @@ class CiscoFirepowerFDMClient(VendorClient):
         Returns:
             CLI output as string
         """
-        result = self._post("action/clicommand", {"commandInput": command})
+        result = self._post_url(self._clicommand_url, {"commandInput": command})
         return result.get("response", "")
 
     def get_hardware_info(self) -> HardwareInfo:
         """Get hardware information from Firepower."""
-        if self._hardware_info:
+        if self._hardware_info is not None:
             return self._hardware_info
 
         try:
-            data = self._get("operational/systeminfo")
+            data = self._get_url(self._systeminfo_url)
 
             self._hardware_info = HardwareInfo(
                 vendor="Cisco",
@@ -341,7 +411,7 @@ class CiscoFirepowerFDMClient(VendorClient):
         """Collect CPU and memory metrics from Firepower."""
         try:
             # Try REST API first
-            data = self._get("operational/devicestatus")
+            data = self._get_url(self._devicestatus_url)
 
             cpu_usage = data.get("cpuUsage", 0.0)
             memory_usage = data.get("memoryUsage", 0.0)
@@ -357,7 +427,7 @@ class CiscoFirepowerFDMClient(VendorClient):
                 cpu_metrics = self._parse_cpu_output(cli_output)
                 vendor_metrics.update(cpu_metrics)
             except Exception as e:
-                LOG.debug(f"Could not get detailed CPU metrics: {e}")
+                LOG.debug("Could not get detailed CPU metrics: %s", e)
 
             return SystemMetrics(
                 timestamp=datetime.now(timezone.utc),
@@ -374,17 +444,10 @@ class CiscoFirepowerFDMClient(VendorClient):
         """Parse CLI 'show cpu usage' output for CPU metrics."""
         metrics = {}
 
-        # Pattern: "CPU utilization for 5 seconds = 15%"
-        patterns = [
-            (r"5 seconds\s*=\s*(\d+(?:\.\d+)?)\s*%", "cpu_5sec"),
-            (r"1 minute\s*=\s*(\d+(?:\.\d+)?)\s*%", "cpu_1min"),
-            (r"5 minutes\s*=\s*(\d+(?:\.\d+)?)\s*%", "cpu_5min"),
-        ]
-
-        for pattern, key in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                metrics[key] = float(match.group(1))
+        for match in _CPU_RE.finditer(output):
+            key = _CPU_INTERVAL_KEYS[match.group(1).lower()]
+            # Keep the first reading for each interval
+            metrics.setdefault(key, float(match.group(2)))
 
         return metrics
 
@@ -393,11 +456,13 @@ class CiscoFirepowerFDMClient(VendorClient):
     ) -> Dict[str, InterfaceSample]:
         """Collect interface statistics from Firepower."""
         try:
-            data = self._get("operational/interfaces")
+            data = self._get_url(self._interfaces_url)
             items = data.get("items", [])
 
             results = {}
             timestamp = datetime.now(timezone.utc)
+            # Set lookup keeps filtering linear in the number of interfaces
+            wanted = set(interfaces) if interfaces else None
 
             for iface in items:
                 name = iface.get("name", "")
@@ -405,7 +470,7 @@ class CiscoFirepowerFDMClient(VendorClient):
                     continue
 
                 # Filter if specific interfaces requested
-                if interfaces and name not in interfaces:
+                if wanted is not None and name not in wanted:
                     continue
 
                 results[name] = InterfaceSample(
@@ -436,9 +501,7 @@ class CiscoFirepowerFDMClient(VendorClient):
             max_sessions = 0
 
             # Parse: "1234 in use, 5678 most used"
-            match = re.search(
-                r"(\d+)\s+in\s+use[,\s]+(\d+)\s+most\s+used", cli_output, re.IGNORECASE
-            )
+            match = _CONN_RE.search(cli_output)
             if match:
                 active_sessions = int(match.group(1))
                 max_sessions = int(match.group(2))
@@ -454,9 +517,20 @@ class CiscoFirepowerFDMClient(VendorClient):
             raise
 
     def discover_interfaces(self) -> List[str]:
-        """Discover available interfaces on Firepower."""
+        """
+        Discover available interfaces on Firepower.
+
+        The result is cached for INTERFACE_CACHE_TTL seconds; call
+        invalidate_interfaces_cache() after an interface change to force a refresh.
+        """
+        if (
+            self._interfaces_cache is not None
+            and time.monotonic() < self._interfaces_cache_deadline
+        ):
+            return list(self._interfaces_cache)
+
         try:
-            data = self._get("operational/interfaces")
+            data = self._get_url(self._interfaces_url)
             items = data.get("items", [])
 
             interfaces = []
@@ -465,12 +539,19 @@ class CiscoFirepowerFDMClient(VendorClient):
                 if name:
                     interfaces.append(name)
 
-            return sorted(interfaces)
+            self._interfaces_cache = sorted(interfaces)
+            self._interfaces_cache_deadline = time.monotonic() + INTERFACE_CACHE_TTL
+            return list(self._interfaces_cache)
 
         except Exception as e:
             LOG.error(f"Failed to discover interfaces: {e}")
             raise
 
+    def invalidate_interfaces_cache(self) -> None:
+        """Drop the cached discover_interfaces() result."""
+        self._interfaces_cache = None
+        self._interfaces_cache_deadline = 0.0
+
     def close(self) -> None:
         """Close the API client and cleanup resources."""
         if self._session:
@@ -483,21 +564,38 @@ class CiscoFirepowerFDMClient(VendorClient):
 
 
 class CiscoFirepowerFMCClient(VendorClient):
-    """
-    Cisco Firepower Management Center (FMC) REST API client.
-
-    FMC provides centralized management for multiple FTD devices.
-    Uses HTTP Basic Auth with tokens in response headers.
-
-    Authentication:
-    - POST /api/fmc_platform/v1/auth/generatetoken with Basic Auth
-    - Tokens returned in X-auth-access-token and X-auth-refresh-token headers
-    - Token valid for 30 minutes, refreshable up to 3 times (90 min max)
-    """
+    """Cisco FMC REST API client. See docs/vendors/cisco_firepower.md for API details."""
 
     VENDOR_NAME = "Cisco Firepower (FMC)"
     VENDOR_TYPE = "cisco_firepower"
 
+    __slots__ = (
+        "_host",
+        "_base_url",
+        "_config_url",
+        "_verify_ssl",
+        "_ca_bundle_path",
+        "_device_id",
+        "_access_token",
+        "_refresh_token",
+        "_domain_uuid",
+        "_token_deadline",
+        "_refresh_count",
+        "_session",
+        "_authenticated",
+        "_hardware_info",
+        "_interfaces_cache",
+        "_interfaces_cache_deadline",
+        "_generatetoken_url",
+        "_refreshtoken_url",
+        "_serverversion_url",
+        "_devicerecords_url",
+        "_device_url",
+        "_health_alerts_url",
+        "_physicalinterfaces_url",
+        "_subinterfaces_url",
+    )
+
     def __init__(
         self,
         host: str,
@@ -525,13 +623,23 @@ class CiscoFirepowerFMCClient(VendorClient):
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._domain_uuid: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        # Token expiry as a time.monotonic() deadline (0.0 until authenticated)
+        self._token_deadline = 0.0
         self._refresh_count = 0  # FMC limits to 3 refreshes
         self._session: Optional[requests.Session] = None
         self._authenticated = False
         self._hardware_info: Optional[HardwareInfo] = None
+        # discover_interfaces() result, reused until the time.monotonic() deadline
+        self._interfaces_cache: Optional[List[str]] = None
+        self._interfaces_cache_deadline = 0.0
 
-        LOG.debug(f"FMC client initialized for {self._host}")
+        # Endpoint URLs are fixed per client, so build them once
+        self._generatetoken_url = f"{self._base_url}/auth/generatetoken"
+        self._refreshtoken_url = f"{self._base_url}/auth/refreshtoken"
+        self._serverversion_url = f"{self._base_url}/info/serverversion"
+        self._set_domain(None)
+
+        LOG.debug("FMC client initialized for %s", self._host)
 
     @property
     def vendor_name(self) -> str:
@@ -549,9 +657,21 @@ class CiscoFirepowerFMCClient(VendorClient):
             return self._ca_bundle_path
         return True
 
+    def _set_domain(self, domain_uuid: Optional[str]) -> None:
+        """Set the FMC domain and rebuild the domain-scoped endpoint URLs."""
+        self._domain_uuid = domain_uuid
+        domain_url = f"{self._config_url}/domain/{domain_uuid}"
+        self._devicerecords_url = f"{domain_url}/devices/devicerecords"
+        self._device_url = f"{self._devicerecords_url}/{self._device_id}"
+        self._health_alerts_url = f"{domain_url}/health/alerts"
+        self._physicalinterfaces_url = f"{self._device_url}/physicalinterfaces"
+        self._subinterfaces_url = f"{self._device_url}/subinterfaces"
+
     def _create_session(self) -> requests.Session:
         """Create and configure a requests session."""
         session = requests.Session()
+        # Per-session adapter keeps each device's keep-alive connection to itself
+        session.mount("https://", HTTPAdapter(max_retries=_RETRY_POLICY))
         session.headers.update(
             {
                 "Content-Type": "application/json",
@@ -571,16 +691,14 @@ class CiscoFirepowerFMCClient(VendorClient):
         Returns:
             True if authentication successful
         """
-        LOG.debug(f"Authenticating to FMC at {self._host}")
+        LOG.debug("Authenticating to FMC at %s", self._host)
 
         self._session = self._create_session()
 
         try:
             # FMC uses Basic Auth, tokens in response headers
-            auth_url = f"{self._base_url}/auth/generatetoken"
-
             response = self._session.post(
-                auth_url,
+                self._generatetoken_url,
                 auth=(username, password),
                 verify=self._get_verify_param(),
                 timeout=DEFAULT_TIMEOUT,
@@ -590,14 +708,14 @@ class CiscoFirepowerFMCClient(VendorClient):
             # Tokens are in response headers, not body
             self._access_token = response.headers.get("X-auth-access-token")
             self._refresh_token = response.headers.get("X-auth-refresh-token")
-            self._domain_uuid = response.headers.get("DOMAIN_UUID")
+            self._set_domain(response.headers.get("DOMAIN_UUID"))
 
             if not self._access_token:
                 LOG.error("No access token in FMC response headers")
                 return False
 
             # FMC tokens valid for 30 minutes
-            self._token_expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+            self._token_deadline = time.monotonic() + FMC_TOKEN_LIFETIME
             self._refresh_count = 0
 
             # Set auth header for subsequent requests
@@ -605,7 +723,7 @@ class CiscoFirepowerFMCClient(VendorClient):
             self._authenticated = True
 
             LOG.info(f"Successfully authenticated to FMC at {self._host}")
-            LOG.debug(f"Domain UUID: {self._domain_uuid}")
+            LOG.debug("Domain UUID: %s", self._domain_uuid)
 
             # Cache hardware info
             try:
@@ -626,14 +744,11 @@ class CiscoFirepowerFMCClient(VendorClient):
 
     def is_authenticated(self) -> bool:
         """Check if client is currently authenticated with valid token."""
-        if not self._authenticated or not self._access_token:
-            return False
-
-        if self._token_expires_at:
-            if datetime.now(timezone.utc) >= self._token_expires_at:
-                return False
-
-        return True
+        return (
+            self._authenticated
+            and self._access_token is not None
+            and time.monotonic() < self._token_deadline
+        )
 
     def _refresh_token_if_needed(self) -> bool:
         """
@@ -647,11 +762,8 @@ class CiscoFirepowerFMCClient(VendorClient):
         if not self._authenticated or not self._session:
             return False
 
-        if not self._token_expires_at:
-            return True
-
-        time_until_expiry = self._token_expires_at - datetime.now(timezone.utc)
-        if time_until_expiry > timedelta(minutes=TOKEN_REFRESH_MARGIN_MINUTES):
+        time_until_expiry = self._token_deadline - time.monotonic()
+        if time_until_expiry > TOKEN_REFRESH_MARGIN_MINUTES * 60:
             return True
 
         # Check if we've exceeded refresh limit
@@ -662,13 +774,11 @@ class CiscoFirepowerFMCClient(VendorClient):
         LOG.debug("Refreshing FMC access token")
 
         try:
-            refresh_url = f"{self._base_url}/auth/refreshtoken"
-
             # Use refresh token header
             headers = {"X-auth-refresh-token": self._refresh_token}
 
             response = self._session.post(
-                refresh_url,
+                self._refreshtoken_url,
                 headers=headers,
                 verify=self._get_verify_param(),
                 timeout=DEFAULT_TIMEOUT,
@@ -678,12 +788,12 @@ class CiscoFirepowerFMCClient(VendorClient):
             self._access_token = response.headers.get("X-auth-access-token")
             self._refresh_token = response.headers.get("X-auth-refresh-token")
 
-            self._token_expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+            self._token_deadline = time.monotonic() + FMC_TOKEN_LIFETIME
             self._refresh_count += 1
 
             self._session.headers["X-auth-access-token"] = self._access_token
 
-            LOG.debug(f"FMC token refreshed successfully (refresh {self._refresh_count}/3)")
+            LOG.debug("FMC token refreshed successfully (refresh %s/3)", self._refresh_count)
             return True
 
         except Exception as e:
@@ -701,17 +811,21 @@ class CiscoFirepowerFMCClient(VendorClient):
         Returns:
             JSON response as dictionary
         """
-        if not self._refresh_token_if_needed():
-            raise RuntimeError("Not authenticated or token refresh failed")
-
         if base == "platform":
             url = f"{self._base_url}/{endpoint.lstrip('/')}"
         else:
             url = f"{self._config_url}/{endpoint.lstrip('/')}"
 
+        return self._get_url(url)
+
+    def _get_url(self, url: str) -> Dict[str, Any]:
+        """Make GET request to a fully built FMC API URL."""
+        if not self._refresh_token_if_needed():
+            raise RuntimeError("Not authenticated or token refresh failed")
+
         response = self._session.get(url, verify=self._get_verify_param(), timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return _json.loads(response.content)
 
     def _post(self, endpoint: str, data: Dict[str, Any], base: str = "config") -> Dict[str, Any]:
         """
@@ -737,7 +851,7 @@ class CiscoFirepowerFMCClient(VendorClient):
             url, json=data, verify=self._get_verify_param(), timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
-        return response.json()
+        return _json.loads(response.content)
 
     def discover_managed_devices(self) -> List[FMCManagedDevice]:
         """
@@ -747,8 +861,7 @@ class CiscoFirepowerFMCClient(VendorClient):
             List of FMCManagedDevice objects
         """
         try:
-            endpoint = f"domain/{self._domain_uuid}/devices/devicerecords"
-            data = self._get(endpoint)
+            data = self._get_url(self._devicerecords_url)
 
             devices = []
             items = data.get("items", [])
@@ -777,14 +890,13 @@ class CiscoFirepowerFMCClient(VendorClient):
 
     def get_hardware_info(self) -> HardwareInfo:
         """Get hardware information from FMC or managed device."""
-        if self._hardware_info:
+        if self._hardware_info is not None:
             return self._hardware_info
 
         try:
             # If device_id specified, get device info
             if self._device_id:
-                endpoint = f"domain/{self._domain_uuid}/devices/devicerecords/{self._device_id}"
-                data = self._get(endpoint)
+                data = self._get_url(self._device_url)
 
                 self._hardware_info = HardwareInfo(
                     vendor="Cisco",
@@ -801,7 +913,7 @@ class CiscoFirepowerFMCClient(VendorClient):
                 )
             else:
                 # Get FMC server info
-                data = self._get("info/serverversion", base="platform")
+                data = self._get_url(self._serverversion_url)
 
                 self._hardware_info = HardwareInfo(
                     vendor="Cisco",
@@ -836,8 +948,7 @@ class CiscoFirepowerFMCClient(VendorClient):
             if self._device_id:
                 # Try to get device health
                 try:
-                    endpoint = f"domain/{self._domain_uuid}/health/alerts"
-                    data = self._get(endpoint)
+                    data = self._get_url(self._health_alerts_url)
                     vendor_metrics["health_alerts"] = len(data.get("items", []))
                 except Exception:
                     pass
@@ -869,21 +980,18 @@ class CiscoFirepowerFMCClient(VendorClient):
 
         try:
             # Get physical interfaces
-            endpoint = (
-                f"domain/{self._domain_uuid}/devices/devicerecords/"
-                f"{self._device_id}/physicalinterfaces"
-            )
-            data = self._get(endpoint)
+            data = self._get_url(self._physicalinterfaces_url)
 
             results = {}
             timestamp = datetime.now(timezone.utc)
+            wanted = set(interfaces) if interfaces else None
 
             for iface in data.get("items", []):
                 name = iface.get("name", "")
                 if not name:
                     continue
 
-                if interfaces and name not in interfaces:
+                if wanted is not None and name not in wanted:
                     continue
 
                 # FMC provides config, not runtime stats
@@ -919,48 +1027,61 @@ class CiscoFirepowerFMCClient(VendorClient):
         )
 
     def discover_interfaces(self) -> List[str]:
-        """Discover available interfaces on managed device."""
+        """
+        Discover available interfaces on managed device.
+
+        A non-empty result is cached for INTERFACE_CACHE_TTL seconds; call
+        invalidate_interfaces_cache() after an interface change to force a refresh.
+        """
         if not self._device_id:
             LOG.warning("No device_id specified, cannot discover interfaces")
             return []
 
+        if (
+            self._interfaces_cache is not None
+            and time.monotonic() < self._interfaces_cache_deadline
+        ):
+            return list(self._interfaces_cache)
+
         try:
             interfaces = []
 
             # Get physical interfaces
-            endpoint = (
-                f"domain/{self._domain_uuid}/devices/devicerecords/"
-                f"{self._device_id}/physicalinterfaces"
-            )
             try:
-                data = self._get(endpoint)
+                data = self._get_url(self._physicalinterfaces_url)
                 for iface in data.get("items", []):
                     name = iface.get("name", "")
                     if name:
                         interfaces.append(name)
             except Exception as e:
-                LOG.debug(f"Could not get physical interfaces: {e}")
+                LOG.debug("Could not get physical interfaces: %s", e)
 
             # Get subinterfaces
-            endpoint = (
-                f"domain/{self._domain_uuid}/devices/devicerecords/"
-                f"{self._device_id}/subinterfaces"
-            )
             try:
-                data = self._get(endpoint)
+                data = self._get_url(self._subinterfaces_url)
                 for iface in data.get("items", []):
                     name = iface.get("name", "")
                     if name:
                         interfaces.append(name)
             except Exception as e:
-                LOG.debug(f"Could not get subinterfaces: {e}")
+                LOG.debug("Could not get subinterfaces: %s", e)
 
-            return sorted(set(interfaces))
+            interfaces = sorted(set(interfaces))
+            # Both lookups swallow errors, so an empty result may be a failure; don't cache it
+            if interfaces:
+                self._interfaces_cache = interfaces
+                self._interfaces_cache_deadline = time.monotonic() + INTERFACE_CACHE_TTL
+            return list(interfaces)
 
         except Exception as e:
             LOG.error(f"Failed to discover interfaces: {e}")
             raise
 
+    def invalidate_interfaces_cache(self) -> None:
+        """Drop the cached discover_interfaces() result."""
+        self._interfaces_cache = None
+        self._interfaces_cache_deadline = 0.0
+
     def close(self) -> None:
         """Close the API client and cleanup resources."""
         if self._session:
@@ -973,20 +1094,13 @@ class CiscoFirepowerFMCClient(VendorClient):
 
 
 class CiscoFirepowerAdapter(VendorAdapter):
-    """
-    Cisco Firepower vendor adapter.
-
-    Factory for creating Firepower clients (FDM or FMC) and providing
-    vendor-specific configuration.
-
-    Supported Management Modes:
-    - fdm: Local device management via FDM REST API
-    - fmc: Centralized management via FMC REST API
-    """
+    """Cisco Firepower vendor adapter creating FDM or FMC clients (see help_url())."""
 
     VENDOR_NAME = "Cisco Firepower"
     VENDOR_TYPE = "cisco_firepower"
 
+    __slots__ = ()
+
     @property
     def vendor_name(self) -> str:
         return self.VENDOR_NAME
@@ -995,6 +1109,11 @@ class CiscoFirepowerAdapter(VendorAdapter):
     def vendor_type(self) -> str:
         return self.VENDOR_TYPE
 
+    @classmethod
+    def help_url(cls) -> str:
+        """Get the URL of the Firepower implementation reference."""
+        return DOCS_URL
+
     def create_client(
         self,
         host: str,
@@ -1021,46 +1140,27 @@ class CiscoFirepowerAdapter(VendorAdapter):
         else:
             return CiscoFirepowerFDMClient(host, verify_ssl, ca_bundle_path)
 
-    def get_supported_metrics(self) -> List[str]:
+    def get_supported_metrics(self) -> Sequence[str]:
         """Get list of metrics supported by Firepower devices."""
-        return [
-            "cpu_usage",
-            "cpu_5sec",
-            "cpu_1min",
-            "cpu_5min",
-            "memory_usage",
-            "disk_usage",
-            "active_connections",
-            "max_connections",
-            "xlate_count",
-        ]
-
-    def get_hardware_fields(self) -> List[str]:
+        return _SUPPORTED_METRICS
+
+    def get_hardware_fields(self) -> Sequence[str]:
         """Get list of hardware info fields for Firepower devices."""
-        return [
-            "model",
-            "serial",
-            "hostname",
-            "sw_version",
-            "device_type",
-            "management_mode",
-        ]
-
-    def get_default_exclude_interfaces(self) -> List[str]:
+        return _HARDWARE_FIELDS
+
+    def get_default_exclude_interfaces(self) -> Sequence[str]:
         """Get default interface exclusion patterns for Firepower."""
-        return [
-            "Management",
-            "Diagnostic",
-            "nlp_int_tap",
-            "ccl_ha_port",
-            "cmi_mgmt_int",
-            "Internal-",
-        ]
+        return _EXCLUDE_PATTERNS
+
+    def get_default_exclude_regex(self) -> "re.Pattern[str]":
+        """Get the precompiled default exclusion regex for Firepower."""
+        return _EXCLUDE_RE
 
 
 # Backward compatibility alias
 CiscoFirepowerClient = CiscoFirepowerFDMClient
 
-# Register this vendor
-register_vendor(CiscoFirepowerAdapter.VENDOR_TYPE, CiscoFirepowerAdapter)
-LOG.debug("Registered Cisco Firepower vendor adapter")
+# Register this vendor (skipped when the module is re-imported into a warm registry)
+if not is_vendor_supported(CiscoFirepowerAdapter.VENDOR_TYPE):
+    register_vendor(CiscoFirepowerAdapter.VENDOR_TYPE, CiscoFirepowerAdapter)
+    LOG.debug("Registered Cisco Firepower vendor adapter")
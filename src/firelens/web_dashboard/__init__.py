@@ -1,22 +1,32 @@
 """
 FireLens Monitor - Web Dashboard Package
 Provides web interface for monitoring firewall metrics, interface bandwidth, and session statistics
+
+Public names are resolved lazily on first access (PEP 562) so importing the
+package does not pull in FastAPI, Jinja2 or SAML until they are actually used.
 """
 
-from .app import EnhancedWebDashboard, WebDashboard
-from .cache import SimpleCache
-from .helpers import (
-    MAX_PASSWORD_LENGTH,
-    MIN_PASSWORD_LENGTH,
-    get_admin_user,
-    get_csrf_token,
-    is_admin_enabled,
-    is_saml_available,
-    validate_csrf,
-    validate_password_complexity,
-)
-from .middleware import CacheControlMiddleware, setup_middleware
-from .session import SessionManager
+import importlib
+
+from ._constants import MAX_PASSWORD_LENGTH, MIN_PASSWORD_LENGTH
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    # Main classes
+    "EnhancedWebDashboard": ("app", "EnhancedWebDashboard"),
+    "WebDashboard": ("app", "WebDashboard"),
+    "SimpleCache": ("cache", "SimpleCache"),
+    "SessionManager": ("session", "SessionManager"),
+    "CacheControlMiddleware": ("middleware", "CacheControlMiddleware"),
+    # Helper functions
+    "validate_password_complexity": ("helpers", "validate_password_complexity"),
+    "get_admin_user": ("helpers", "get_admin_user"),
+    "get_csrf_token": ("helpers", "get_csrf_token"),
+    "validate_csrf": ("helpers", "validate_csrf"),
+    "is_admin_enabled": ("helpers", "is_admin_enabled"),
+    "is_saml_available": ("helpers", "is_saml_available"),
+    "setup_middleware": ("middleware", "setup_middleware"),
+}
 
 __all__ = [
     # Main classes
@@ -37,3 +47,18 @@ __all__ = [
     "MIN_PASSWORD_LENGTH",
     "MAX_PASSWORD_LENGTH",
 ]
+
+
+def __getattr__(name):
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{spec[0]}", __name__)
+    obj = getattr(module, spec[1])
+    # Cache on the package so later lookups bypass __getattr__ entirely
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,8 @@
+"""
+FireLens Monitor - Web Dashboard Constants
+Dependency-free values shared by the package namespace and helpers
+"""
+
+# Password complexity requirements
+MIN_PASSWORD_LENGTH = 12
+MAX_PASSWORD_LENGTH = 128
@@ -7,9 +7,7 @@ from typing import Optional, Tuple
 
 from fastapi import Request
 
-# Password complexity requirements
-MIN_PASSWORD_LENGTH = 12
-MAX_PASSWORD_LENGTH = 128
+from ._constants import MAX_PASSWORD_LENGTH, MIN_PASSWORD_LENGTH
 
 
 def validate_password_complexity(password: str) -> Tuple[bool, str]:
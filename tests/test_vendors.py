@@ -3,6 +3,8 @@
 Unit tests for vendor abstraction layer
 Tests vendor registry, adapters, and client interfaces
 """
+
+import json
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -28,6 +30,29 @@ class TestVendorRegistry(unittest.TestCase):
 
         self.assertTrue(is_vendor_supported("cisco_firepower"))
 
+    def test_cisco_firepower_reimport_skips_registration(self):
+        """Test re-importing the Cisco module does not re-register the vendor"""
+        import importlib.util
+        import sys
+
+        from firelens.vendors import cisco_firepower, get_vendor_adapter
+
+        # Execute a second copy of the module under a throwaway name so the shared
+        # module, its classes and the registry entry are left untouched
+        name = "firelens.vendors._cisco_firepower_reimport"
+        spec = importlib.util.spec_from_file_location(name, cisco_firepower.__file__)
+        module = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {name: module}):
+            with patch("firelens.vendors.register_vendor") as mock_register:
+                spec.loader.exec_module(module)
+
+        mock_register.assert_not_called()
+        self.assertNotIn(name, sys.modules)
+        self.assertIs(sys.modules["firelens.vendors.cisco_firepower"], cisco_firepower)
+        self.assertIsInstance(
+            get_vendor_adapter("cisco_firepower"), cisco_firepower.CiscoFirepowerAdapter
+        )
+
     def test_unknown_vendor_not_supported(self):
         """Test that unknown vendor types are not supported"""
         from firelens.vendors import is_vendor_supported
@@ -177,6 +202,27 @@ class TestVendorBaseClasses(unittest.TestCase):
         self.assertAlmostEqual(metrics.memory_usage, 60.0)
         self.assertEqual(metrics.vendor_metrics["mgmt_cpu"], 30.0)
 
+    def test_interface_sample_is_immutable(self):
+        """Test InterfaceSample is frozen and slotted where supported"""
+        import sys
+        from dataclasses import FrozenInstanceError
+        from datetime import datetime, timezone
+        from firelens.vendors.base import InterfaceSample
+
+        sample = InterfaceSample(
+            timestamp=datetime.now(timezone.utc),
+            interface_name="ethernet1/1",
+            rx_bytes=1000,
+            tx_bytes=2000,
+            rx_packets=100,
+            tx_packets=200,
+        )
+
+        with self.assertRaises(FrozenInstanceError):
+            sample.rx_bytes = 0
+        if sys.version_info >= (3, 10):
+            self.assertFalse(hasattr(sample, "__dict__"))
+
 
 class TestPaloAltoAdapter(unittest.TestCase):
     """Test Palo Alto vendor adapter"""
@@ -729,6 +775,40 @@ class TestCiscoFirepowerAdapter(unittest.TestCase):
         self.assertIn("memory_usage", metrics)
         self.assertIn("active_connections", metrics)
 
+    def test_clients_and_adapter_use_slots(self):
+        """Test Firepower clients and adapter carry no per-instance __dict__"""
+        from firelens.vendors.cisco_firepower import (
+            CiscoFirepowerAdapter,
+            CiscoFirepowerFDMClient,
+            CiscoFirepowerFMCClient,
+        )
+
+        for obj in (
+            CiscoFirepowerAdapter(),
+            CiscoFirepowerFDMClient("192.168.1.1"),
+            CiscoFirepowerFMCClient("fmc.example.com", device_id="abc"),
+        ):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_help_url_points_to_vendor_docs(self):
+        """Test adapter exposes the implementation reference URL"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerAdapter
+
+        self.assertTrue(
+            CiscoFirepowerAdapter.help_url().endswith("docs/vendors/cisco_firepower.md")
+        )
+
+    def test_capability_lists_are_shared(self):
+        """Test capability lists are immutable and not rebuilt per call"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerAdapter
+
+        adapter = CiscoFirepowerAdapter()
+
+        self.assertIsInstance(adapter.get_supported_metrics(), tuple)
+        self.assertIs(adapter.get_supported_metrics(), adapter.get_supported_metrics())
+        self.assertIs(adapter.get_hardware_fields(), adapter.get_hardware_fields())
+        self.assertIn("management_mode", adapter.get_hardware_fields())
+
     def test_fdm_client_initialization(self):
         """Test Cisco Firepower FDM client initialization"""
         from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
@@ -760,6 +840,261 @@ class TestCiscoFirepowerAdapter(unittest.TestCase):
         self.assertIn("Diagnostic", excludes)
         self.assertIn("nlp_int_tap", excludes)
 
+    def test_default_exclude_regex(self):
+        """Test compiled exclusion regex is a case-insensitive substring match"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerAdapter
+
+        adapter = CiscoFirepowerAdapter()
+        pattern = adapter.get_default_exclude_regex()
+
+        self.assertIsNotNone(pattern.search("Management0/0"))
+        self.assertIsNotNone(pattern.search("diagnostic1/1"))
+        self.assertIsNotNone(pattern.search("Internal-Data0/1"))
+        self.assertIsNotNone(pattern.search("port-channel.nlp_int_tap"))
+        self.assertIsNone(pattern.search("GigabitEthernet0/1"))
+        self.assertIsNone(pattern.search("outside"))
+
+    def test_default_exclude_regex_on_base_adapter(self):
+        """Test every adapter's regex finds its exclusions anywhere, in any case"""
+        from firelens.vendors import get_available_vendors, get_vendor_adapter
+
+        for vendor_type in get_available_vendors():
+            adapter = get_vendor_adapter(vendor_type)
+            pattern = adapter.get_default_exclude_regex()
+            for name in adapter.get_default_exclude_interfaces():
+                self.assertIsNotNone(pattern.search(f"x-{name.upper()}0"), (vendor_type, name))
+
+
+class TestCiscoFirepowerFDMClient(unittest.TestCase):
+    """Test Cisco Firepower FDM API client"""
+
+    def _mock_session(self, mock_session_class):
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+
+        payload = {
+            "access_token": "access",
+            "refresh_token": "refresh",
+            "expires_in": 1800,
+            "model": "Cisco Firepower 2110",
+            "serialNumber": "JAD12345678",
+            "hostname": "ftd-01",
+            "softwareVersion": "7.2.0",
+        }
+        mock_response = Mock()
+        mock_response.json.return_value = payload
+        mock_response.content = json.dumps(payload).encode()
+        mock_response.raise_for_status = Mock()
+        mock_session.post.return_value = mock_response
+        mock_session.get.return_value = mock_response
+        return mock_session
+
+    @patch("requests.Session")
+    def test_authenticate_caches_hardware_info(self, mock_session_class):
+        """Test hardware info is parsed from the raw response body"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        self._mock_session(mock_session_class)
+
+        client = CiscoFirepowerFDMClient("192.168.1.1", verify_ssl=False)
+        self.assertTrue(client.authenticate("admin", "password"))
+
+        info = client.get_hardware_info()
+        self.assertEqual(info.model, "Cisco Firepower 2110")
+        self.assertEqual(info.serial, "JAD12345678")
+        self.assertEqual(info.vendor_specific["management_mode"], "fdm")
+
+    @patch("requests.Session")
+    def test_token_deadline_controls_authentication(self, mock_session_class):
+        """Test is_authenticated follows the monotonic token deadline"""
+        import time
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        self._mock_session(mock_session_class)
+
+        client = CiscoFirepowerFDMClient("192.168.1.1", verify_ssl=False)
+        self.assertTrue(client.authenticate("admin", "password"))
+        self.assertTrue(client.is_authenticated())
+        self.assertGreater(client._token_deadline, time.monotonic() + 1700)
+
+        client._token_deadline = time.monotonic() - 1
+        self.assertFalse(client.is_authenticated())
+
+    def test_endpoint_urls_precomputed(self):
+        """Test endpoint URLs are built once from the normalized host"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        client = CiscoFirepowerFDMClient("192.168.1.1/")
+
+        self.assertEqual(client._token_url, "https://192.168.1.1/api/fdm/v6/fdm/token")
+        self.assertEqual(
+            client._interfaces_url, "https://192.168.1.1/api/fdm/v6/operational/interfaces"
+        )
+
+    def test_each_session_keeps_its_own_connection_pool(self):
+        """Test many clients never share (and evict) one another's connection pools"""
+        from firelens.vendors.cisco_firepower import _RETRY_POLICY, CiscoFirepowerFDMClient
+
+        clients = [CiscoFirepowerFDMClient(f"10.0.0.{i}") for i in range(40)]
+        adapters = []
+        for i, client in enumerate(clients):
+            client._session = client._create_session()
+            adapter = client._session.get_adapter(f"https://10.0.0.{i}")
+            adapter.poolmanager.connection_from_url(f"https://10.0.0.{i}")
+            adapters.append(adapter)
+
+        self.assertEqual(len({id(a) for a in adapters}), len(clients))
+        for adapter in adapters:
+            self.assertIs(adapter.max_retries, _RETRY_POLICY)
+            self.assertEqual(len(adapter.poolmanager.pools), 1)
+
+        for client in clients:
+            client.close()
+
+    def test_retry_policy_retries_only_throttling_statuses(self):
+        """Test connect errors and read timeouts are not retried"""
+        from firelens.vendors.cisco_firepower import _RETRY_POLICY
+
+        self.assertEqual(_RETRY_POLICY.connect, 0)
+        self.assertFalse(_RETRY_POLICY.read)
+        self.assertEqual(_RETRY_POLICY.status, 3)
+        self.assertEqual(set(_RETRY_POLICY.status_forcelist), {429, 503})
+
+    def test_async_variants_fan_out(self):
+        """Test async variants can gather results from several clients"""
+        import asyncio
+        from datetime import datetime, timezone
+        from firelens.vendors.base import SessionStats
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        stats = SessionStats(
+            timestamp=datetime.now(timezone.utc), active_sessions=5, max_sessions=9
+        )
+        clients = [CiscoFirepowerFDMClient(f"10.0.0.{i}") for i in range(3)]
+
+        async def poll():
+            return await asyncio.gather(*(c.acollect_session_stats() for c in clients))
+
+        with patch.object(CiscoFirepowerFDMClient, "collect_session_stats", return_value=stats):
+            results = asyncio.run(poll())
+
+        self.assertEqual(results, [stats, stats, stats])
+
+    def test_discover_interfaces_cached_until_invalidated(self):
+        """Test discover_interfaces reuses its result within the TTL"""
+        import time
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        client = CiscoFirepowerFDMClient("192.168.1.1")
+        data = {"items": [{"name": "outside"}, {"name": "inside"}, {"name": ""}]}
+
+        with patch.object(CiscoFirepowerFDMClient, "_get_url", return_value=data) as mock_get:
+            self.assertEqual(client.discover_interfaces(), ["inside", "outside"])
+            self.assertEqual(client.discover_interfaces(), ["inside", "outside"])
+            self.assertEqual(mock_get.call_count, 1)
+
+            client._interfaces_cache_deadline = time.monotonic() - 1
+            client.discover_interfaces()
+            self.assertEqual(mock_get.call_count, 2)
+
+            client.invalidate_interfaces_cache()
+            client.discover_interfaces()
+            self.assertEqual(mock_get.call_count, 3)
+
+    def test_parse_cpu_output(self):
+        """Test 'show cpu usage' parsing with '=' and ':' separators"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        client = CiscoFirepowerFDMClient("192.168.1.1")
+        metrics = client._parse_cpu_output(
+            "CPU utilization for 5 seconds = 15%; 1 minute: 12.5%; 5 minutes: 10%"
+        )
+
+        self.assertEqual(metrics, {"cpu_5sec": 15.0, "cpu_1min": 12.5, "cpu_5min": 10.0})
+        self.assertEqual(client._parse_cpu_output("no cpu data"), {})
+
+    def test_collect_session_stats_parses_conn_count(self):
+        """Test 'show conn count' parsing"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        with patch.object(
+            CiscoFirepowerFDMClient, "_execute_cli", return_value="1234 in use, 5678 most used"
+        ):
+            stats = CiscoFirepowerFDMClient("192.168.1.1").collect_session_stats()
+
+        self.assertEqual(stats.active_sessions, 1234)
+        self.assertEqual(stats.max_sessions, 5678)
+
+    def test_collect_interface_stats_filters_requested(self):
+        """Test interface stats are built from REST items and filtered by name"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFDMClient
+
+        items = {
+            "items": [
+                {"name": "outside", "inBytes": 100, "outBytes": 200, "inPackets": 1},
+                {"name": "inside", "inBytes": 300, "outBytes": 400},
+                {"name": ""},
+            ]
+        }
+        with patch.object(CiscoFirepowerFDMClient, "_get_url", return_value=items):
+            client = CiscoFirepowerFDMClient("192.168.1.1")
+            all_stats = client.collect_interface_stats()
+            filtered = client.collect_interface_stats(["inside"])
+
+        self.assertEqual(sorted(all_stats), ["inside", "outside"])
+        self.assertEqual(all_stats["outside"].rx_bytes, 100)
+        self.assertEqual(all_stats["outside"].rx_packets, 1)
+        self.assertEqual(all_stats["outside"].tx_packets, 0)
+        self.assertEqual(list(filtered), ["inside"])
+        self.assertEqual(filtered["inside"].tx_bytes, 400)
+
+    def test_requests_require_authentication(self):
+        """Test API calls fail fast when the client is not authenticated"""
+        from firelens.vendors.cisco_firepower import (
+            CiscoFirepowerFDMClient,
+            CiscoFirepowerFMCClient,
+        )
+
+        for client in (
+            CiscoFirepowerFDMClient("192.168.1.1"),
+            CiscoFirepowerFMCClient("fmc.example.com"),
+        ):
+            with self.assertRaises(RuntimeError) as ctx:
+                client._get("operational/systeminfo")
+            self.assertIn("Not authenticated", str(ctx.exception))
+
+
+class TestCiscoFirepowerFMCClient(unittest.TestCase):
+    """Test Cisco Firepower FMC API client"""
+
+    @patch("requests.Session")
+    def test_authenticate_builds_domain_urls(self, mock_session_class):
+        """Test domain-scoped endpoint URLs are built from the auth response"""
+        from firelens.vendors.cisco_firepower import CiscoFirepowerFMCClient
+
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_response = Mock()
+        mock_response.headers = {
+            "X-auth-access-token": "access",
+            "X-auth-refresh-token": "refresh",
+            "DOMAIN_UUID": "dom-1",
+        }
+        mock_response.content = b'{"model": "FTD", "name": "ftd-01"}'
+        mock_response.raise_for_status = Mock()
+        mock_session.post.return_value = mock_response
+        mock_session.get.return_value = mock_response
+
+        client = CiscoFirepowerFMCClient("fmc.example.com", device_id="dev-1")
+        self.assertTrue(client.authenticate("api", "password"))
+
+        expected = (
+            "https://fmc.example.com/api/fmc_config/v1/domain/dom-1/devices/devicerecords/dev-1"
+        )
+        self.assertEqual(client._device_url, expected)
+        self.assertEqual(client._physicalinterfaces_url, f"{expected}/physicalinterfaces")
+        mock_session.get.assert_called_with(expected, verify=True, timeout=30)
+
 
 class TestConfigVendorType(unittest.TestCase):
     """Test vendor type field in configuration"""
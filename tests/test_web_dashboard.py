@@ -2,6 +2,7 @@
 """
 Unit tests for web dashboard caching and health endpoint
 """
+
 import unittest
 import time
 from datetime import datetime, timezone
@@ -435,6 +436,59 @@ class TestPasswordConstants(unittest.TestCase):
         self.assertGreaterEqual(MAX_PASSWORD_LENGTH, 64)  # Allow reasonably long passwords
         self.assertLessEqual(MAX_PASSWORD_LENGTH, 256)  # But have a reasonable upper limit
 
+    def test_constants_shared_with_helpers(self):
+        """Test package constants are the same values helpers validate against"""
+        import firelens.web_dashboard as wd
+        from firelens.web_dashboard import helpers
+
+        self.assertIn("MIN_PASSWORD_LENGTH", vars(wd))
+        self.assertIn("MAX_PASSWORD_LENGTH", vars(wd))
+        self.assertEqual(wd.MIN_PASSWORD_LENGTH, helpers.MIN_PASSWORD_LENGTH)
+        self.assertEqual(wd.MAX_PASSWORD_LENGTH, helpers.MAX_PASSWORD_LENGTH)
+
+
+class TestLazyPackageExports(unittest.TestCase):
+    """Test lazy resolution of web_dashboard public names"""
+
+    def test_all_public_names_resolve(self):
+        """Test every name in __all__ can be accessed"""
+        import firelens.web_dashboard as wd
+
+        for name in wd.__all__:
+            self.assertIsNotNone(getattr(wd, name), name)
+
+    def test_resolved_name_is_cached(self):
+        """Test resolved names are stored in the package namespace"""
+        import firelens.web_dashboard as wd
+        from firelens.web_dashboard.cache import SimpleCache
+
+        self.assertIs(wd.SimpleCache, SimpleCache)
+        self.assertIs(vars(wd)["SimpleCache"], SimpleCache)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test unknown attributes raise AttributeError"""
+        import firelens.web_dashboard as wd
+
+        with self.assertRaises(AttributeError):
+            wd.DoesNotExist
+
+    def test_dir_lists_public_names(self):
+        """Test dir() exposes the public names for tab completion"""
+        import firelens.web_dashboard as wd
+
+        self.assertEqual(dir(wd), sorted(wd.__all__))
+
+    def test_package_import_does_not_load_fastapi(self):
+        """Test importing the package (and firelens itself) leaves FastAPI unloaded"""
+        import os
+        import subprocess
+        import sys
+
+        code = "import sys, firelens, firelens.web_dashboard; " "sys.exit('fastapi' in sys.modules)"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], env=env)
+        self.assertEqual(result.returncode, 0)
+
 
 class TestSessionManager(unittest.TestCase):
     """Test session manager functionality"""